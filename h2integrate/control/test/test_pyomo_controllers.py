@@ -1,5 +1,4 @@
 import numpy as np
-import pytest
 import openmdao.api as om
 
 from h2integrate.storage.battery.pysam_battery import PySAMBatteryPerformanceModel
@@ -257,29 +256,40 @@ def test_heuristic_load_following_battery_dispatch(subtests):
     )
 
     with subtests.test("Check electricity_out"):
-        assert (
-            pytest.approx(expected_electricity_out) == prob.get_val("battery.electricity_out")[0:24]
+        np.testing.assert_allclose(
+            prob.get_val("battery.electricity_out")[0:24],
+            expected_electricity_out,
+            rtol=1e-6,
+            atol=1e-6,
         )
 
     with subtests.test("Check battery_electricity_discharge"):
-        assert (
-            pytest.approx(expected_battery_electricity_discharge)
-            == prob.get_val("battery.battery_electricity_discharge")[0:24]
+        np.testing.assert_allclose(
+            prob.get_val("battery.battery_electricity_discharge")[0:24],
+            expected_battery_electricity_discharge,
+            rtol=1e-6,
+            atol=1e-6,
         )
 
     with subtests.test("Check SOC"):
-        assert pytest.approx(expected_SOC) == prob.get_val("battery.SOC")[0:24]
+        np.testing.assert_allclose(
+            prob.get_val("battery.SOC")[0:24], expected_SOC, rtol=1e-6, atol=1e-6
+        )
 
     with subtests.test("Check unmet_demand"):
-        assert (
-            pytest.approx(expected_unmet_demand_out, abs=1e-4)
-            == prob.get_val("battery.unmet_electricity_demand_out")[0:24]
+        np.testing.assert_allclose(
+            prob.get_val("battery.unmet_electricity_demand_out")[0:24],
+            expected_unmet_demand_out,
+            rtol=0,
+            atol=1e-4,
         )
 
     with subtests.test("Check unused_electricity_out"):
-        assert (
-            pytest.approx(expected_unused_commodity_out)
-            == prob.get_val("battery.unused_electricity_out")[0:24]
+        np.testing.assert_allclose(
+            prob.get_val("battery.unused_electricity_out")[0:24],
+            expected_unused_commodity_out,
+            rtol=1e-6,
+            atol=1e-6,
         )
 
     # Test the case where the battery is discharged to its lower SOC limit
@@ -311,29 +321,40 @@ def test_heuristic_load_following_battery_dispatch(subtests):
     expected_unused_commodity_out = np.zeros(5)
 
     with subtests.test("Check electricity_out for min SOC"):
-        assert (
-            pytest.approx(expected_electricity_out) == prob.get_val("battery.electricity_out")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.electricity_out")[:5],
+            expected_electricity_out,
+            rtol=1e-6,
+            atol=1e-6,
         )
 
     with subtests.test("Check battery_electricity_discharge for min SOC"):
-        assert (
-            pytest.approx(expected_battery_electricity_discharge)
-            == prob.get_val("battery.battery_electricity_discharge")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.battery_electricity_discharge")[:5],
+            expected_battery_electricity_discharge,
+            rtol=1e-6,
+            atol=1e-6,
         )
 
     with subtests.test("Check SOC for min SOC"):
-        assert pytest.approx(expected_SOC) == prob.get_val("battery.SOC")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.SOC")[:5], expected_SOC, rtol=1e-6, atol=1e-6
+        )
 
     with subtests.test("Check unmet_demand for min SOC"):
-        assert (
-            pytest.approx(expected_unmet_demand_out, abs=1e-6)
-            == prob.get_val("battery.unmet_electricity_demand_out")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.unmet_electricity_demand_out")[:5],
+            expected_unmet_demand_out,
+            rtol=0,
+            atol=1e-6,
         )
 
     with subtests.test("Check unused_commodity_out for min SOC"):
-        assert (
-            pytest.approx(expected_unused_commodity_out)
-            == prob.get_val("battery.unused_electricity_out")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.unused_electricity_out")[:5],
+            expected_unused_commodity_out,
+            rtol=1e-6,
+            atol=1e-6,
         )
 
     # Test the case where the battery is charged to its upper SOC limit
@@ -374,28 +395,38 @@ def test_heuristic_load_following_battery_dispatch(subtests):
     abs_tol = 1e-6
     rel_tol = 1e-1
     with subtests.test("Check electricity_out for max SOC"):
-        assert (
-            pytest.approx(expected_electricity_out, abs=abs_tol, rel=rel_tol)
-            == prob.get_val("battery.electricity_out")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.electricity_out")[:5],
+            expected_electricity_out,
+            rtol=rel_tol,
+            atol=abs_tol,
         )
 
     with subtests.test("Check battery_electricity_discharge for max SOC"):
-        assert (
-            pytest.approx(expected_battery_electricity_discharge, abs=abs_tol, rel=rel_tol)
-            == prob.get_val("battery.battery_electricity_discharge")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.battery_electricity_discharge")[:5],
+            expected_battery_electricity_discharge,
+            rtol=rel_tol,
+            atol=abs_tol,
         )
 
     with subtests.test("Check SOC for max SOC"):
-        assert pytest.approx(expected_SOC, abs=abs_tol) == prob.get_val("battery.SOC")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.SOC")[:5], expected_SOC, rtol=0, atol=abs_tol
+        )
 
     with subtests.test("Check unmet_demand for max SOC"):
-        assert (
-            pytest.approx(expected_unmet_demand_out, abs=abs_tol)
-            == prob.get_val("battery.unmet_electricity_demand_out")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.unmet_electricity_demand_out")[:5],
+            expected_unmet_demand_out,
+            rtol=0,
+            atol=abs_tol,
         )
 
     with subtests.test("Check unused_commodity_out for max SOC"):
-        assert (
-            pytest.approx(expected_unused_commodity_out, abs=abs_tol, rel=rel_tol)
-            == prob.get_val("battery.unused_electricity_out")[:5]
+        np.testing.assert_allclose(
+            prob.get_val("battery.unused_electricity_out")[:5],
+            expected_unused_commodity_out,
+            rtol=rel_tol,
+            atol=abs_tol,
         )
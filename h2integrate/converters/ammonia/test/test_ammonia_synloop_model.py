@@ -11,7 +11,7 @@ from h2integrate.core.inputs.validation import load_tech_yaml, load_plant_yaml,
 from h2integrate.converters.ammonia.ammonia_synloop import AmmoniaSynLoopPerformanceModel
 
 
-@fixture
+@fixture(scope="module")
 def synloop_config():
     return {
         "model_inputs": {
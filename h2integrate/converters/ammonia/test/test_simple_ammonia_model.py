@@ -1,15 +1,37 @@
 import numpy as np
-import pytest
 import openmdao.api as om
 from pytest import fixture
 
+from h2integrate.converters.test.utilities import assert_standard_converter_outputs
 from h2integrate.converters.ammonia.simple_ammonia_model import (
     SimpleAmmoniaCostModel,
     SimpleAmmoniaPerformanceModel,
 )
 
 
-@fixture
+EXPECTED_COSTS = {
+    "capex_air_separation_cryogenic": 853619.36456877,
+    "capex_haber_bosch": 707090.74827636,
+    "capex_boiler": 268119.3387603,
+    "capex_cooling_tower": 182025.76432338,
+    "capex_direct": 2010855.21592881,
+    "capex_depreciable_nonequipment": 853454.92310814,
+    "CapEx": 2864310.13903695,
+    "land_cost": 62946.66128355,
+    "labor_cost": 1278414.87818485,
+    "general_administration_cost": 255682.97563697,
+    "property_tax_insurance": 57286.20278074,
+    "maintenance_cost": 253.15324433,
+    "OpEx": 1654583.87113044,
+    "H2_cost_in_startup_year": 355111.9254,
+    "energy_cost_in_startup_year": 9885.33,
+    "non_energy_cost_in_startup_year": 2282.92326095,
+    "variable_cost_in_startup_year": 12168.25326095,
+    "credits_byproduct": 0.0,
+}
+
+
+@fixture(scope="module")
 def plant_config():
     plant_config = {
         "plant": {
@@ -23,7 +45,7 @@ def plant_config():
     return plant_config
 
 
-@fixture
+@fixture(scope="module")
 def tech_config():
     tech_config_dict = {
         "model_inputs": {
@@ -50,95 +72,58 @@ def tech_config():
     return tech_config_dict
 
 
-def test_simple_ammonia_performance_model_outputs(plant_config, tech_config, subtests):
+@fixture(scope="module")
+def ammonia_performance_prob(plant_config, tech_config):
     prob = om.Problem()
     comp = SimpleAmmoniaPerformanceModel(
         plant_config=plant_config,
         tech_config=tech_config,
     )
 
-    plant_life = int(plant_config["plant"]["plant_life"])
     n_timesteps = int(plant_config["plant"]["simulation"]["n_timesteps"])
 
     prob.model.add_subsystem("comp", comp)
     prob.setup()
     # Set dummy hydrogen input (array of n_timesteps for shape test)
-    prob.set_val("comp.hydrogen_in", [10.0] * n_timesteps, units="kg/h")
+    prob.set_val("comp.hydrogen_in", np.full(n_timesteps, 10.0), units="kg/h")
     prob.run_model()
-    commodity = "ammonia"
-    commodity_amount_units = "kg"
-    commodity_rate_units = "kg/h"
-
-    # Check that replacement schedule is between 0 and 1
-    with subtests.test("0 <= replacement_schedule <=1"):
-        assert np.all(prob.get_val("comp.replacement_schedule", units="unitless") >= 0)
-        assert np.all(prob.get_val("comp.replacement_schedule", units="unitless") <= 1)
-
-    with subtests.test("replacement_schedule length"):
-        assert len(prob.get_val("comp.replacement_schedule", units="unitless")) == plant_life
-
-    # Check that capacity factor is between 0 and 1 with units of "unitless"
-    with subtests.test("0 <= capacity_factor (unitless) <=1"):
-        assert np.all(prob.get_val("comp.capacity_factor", units="unitless") >= 0)
-        assert np.all(prob.get_val("comp.capacity_factor", units="unitless") <= 1)
-
-    # Check that capacity factor is between 1 and 100 with units of "percent"
-    with subtests.test("1 <= capacity_factor (percent) <=1"):
-        assert np.all(prob.get_val("comp.capacity_factor", units="percent") >= 1)
-        assert np.all(prob.get_val("comp.capacity_factor", units="percent") <= 100)
-
-    with subtests.test("capacity_factor length"):
-        assert len(prob.get_val("comp.capacity_factor", units="unitless")) == plant_life
-
-    # Test that rated commodity production is greater than zero
-    with subtests.test(f"rated_{commodity}_production > 0"):
-        assert np.all(
-            prob.get_val(f"comp.rated_{commodity}_production", units=commodity_rate_units) > 0
-        )
-
-    with subtests.test(f"rated_{commodity}_production length"):
-        assert (
-            len(prob.get_val(f"comp.rated_{commodity}_production", units=commodity_rate_units)) == 1
-        )
-
-    # Test that total commodity production is greater than zero
-    with subtests.test(f"total_{commodity}_produced > 0"):
-        assert np.all(
-            prob.get_val(f"comp.total_{commodity}_produced", units=commodity_amount_units) > 0
-        )
-    with subtests.test(f"total_{commodity}_produced length"):
-        assert (
-            len(prob.get_val(f"comp.total_{commodity}_produced", units=commodity_amount_units)) == 1
-        )
-
-    # Test that annual commodity production is greater than zero
-    with subtests.test(f"annual_{commodity}_produced > 0"):
-        assert np.all(
-            prob.get_val(f"comp.annual_{commodity}_produced", units=f"{commodity_amount_units}/yr")
-            > 0
-        )
-
-    with subtests.test(f"annual_{commodity}_produced[1:] == annual_{commodity}_produced[0]"):
-        annual_production = prob.get_val(
-            f"comp.annual_{commodity}_produced", units=f"{commodity_amount_units}/yr"
-        )
-        assert np.all(annual_production[1:] == annual_production[0])
-
-    with subtests.test(f"annual_{commodity}_produced length"):
-        assert len(annual_production) == plant_life
-
-    # Test that commodity output has some values greater than zero
-    with subtests.test(f"Some of {commodity}_out > 0"):
-        assert np.any(prob.get_val(f"comp.{commodity}_out", units=commodity_rate_units) > 0)
-
-    with subtests.test(f"{commodity}_out length"):
-        assert len(prob.get_val(f"comp.{commodity}_out", units=commodity_rate_units)) == n_timesteps
-
-    # Test default values
-    with subtests.test("operational_life default value"):
-        assert prob.get_val("comp.operational_life", units="yr") == plant_life
-    with subtests.test("replacement_schedule value"):
-        assert np.all(prob.get_val("comp.replacement_schedule", units="unitless") == 0)
+    return prob
+
+
+@fixture(scope="module")
+def ammonia_cost_prob(plant_config, tech_config):
+    prob = om.Problem()
+    comp = SimpleAmmoniaCostModel(
+        plant_config=plant_config,
+        tech_config=tech_config,
+    )
+
+    prob.model.add_subsystem("ammonia_cost", comp)
+    prob.setup()
+
+    # Set required inputs
+    prob.set_val("ammonia_cost.plant_capacity_kgpy", 1000000.0, units="kg/year")
+    prob.set_val("ammonia_cost.plant_capacity_factor", 0.9)
+    prob.set_val("ammonia_cost.LCOH", 2.0, units="USD/kg")
+    prob.run_model()
+    return prob
+
+
+def test_simple_ammonia_performance_model_outputs(ammonia_performance_prob, plant_config, subtests):
+    prob = ammonia_performance_prob
+
+    plant_life = int(plant_config["plant"]["plant_life"])
+    n_timesteps = int(plant_config["plant"]["simulation"]["n_timesteps"])
+
+    assert_standard_converter_outputs(
+        prob,
+        subtests,
+        commodity="ammonia",
+        commodity_rate_units="kg/h",
+        commodity_amount_units="kg",
+        plant_life=plant_life,
+        n_timesteps=n_timesteps,
+    )
 
 
 def test_simple_ammonia_performance_model(tech_config, subtests):
@@ -158,61 +143,26 @@ def test_simple_ammonia_performance_model(tech_config, subtests):
     prob.model.add_subsystem("ammonia_perf", comp)
     prob.setup()
     # Set dummy hydrogen input (array of n_timesteps for shape test)
-    prob.set_val("ammonia_perf.hydrogen_in", [10.0] * 2, units="kg/h")
+    prob.set_val("ammonia_perf.hydrogen_in", np.full(2, 10.0), units="kg/h")
     prob.run_model()
     # Dummy expected values
     expected_total = 1000000.0 * 0.9
     expected_out = expected_total / 2
 
     with subtests.test("total ammonia produced"):
-        assert pytest.approx(prob.get_val("ammonia_perf.total_ammonia_produced")) == expected_total
+        total_ammonia = prob.get_val("ammonia_perf.total_ammonia_produced")
+        assert np.all(np.isclose(total_ammonia, expected_total, rtol=1e-6, atol=0.0))
 
     with subtests.test("performance output"):
-        assert all(
-            pytest.approx(x) == expected_out for x in prob.get_val("ammonia_perf.ammonia_out")
-        )
-
-
-def test_simple_ammonia_cost_model(plant_config, tech_config, subtests):
-    plant_config["plant"]["simulation"]
-
-    prob = om.Problem()
-    comp = SimpleAmmoniaCostModel(
-        plant_config=plant_config,
-        tech_config=tech_config,
-    )
+        ammonia_out = prob.get_val("ammonia_perf.ammonia_out")
+        assert np.all(np.isclose(ammonia_out, expected_out, rtol=1e-6, atol=0.0))
 
-    prob.model.add_subsystem("ammonia_cost", comp)
-    prob.setup()
-
-    # Set required inputs
-    prob.set_val("ammonia_cost.plant_capacity_kgpy", 1000000.0, units="kg/year")
-    prob.set_val("ammonia_cost.plant_capacity_factor", 0.9)
-    prob.set_val("ammonia_cost.LCOH", 2.0, units="USD/kg")
-    prob.run_model()
 
-    expected_outputs = {
-        "capex_air_separation_cryogenic": [853619.36456877],
-        "capex_haber_bosch": [707090.74827636],
-        "capex_boiler": [268119.3387603],
-        "capex_cooling_tower": [182025.76432338],
-        "capex_direct": [2010855.21592881],
-        "capex_depreciable_nonequipment": [853454.92310814],
-        "CapEx": [2864310.13903695],
-        "land_cost": [62946.66128355],
-        "labor_cost": [1278414.87818485],
-        "general_administration_cost": [255682.97563697],
-        "property_tax_insurance": [57286.20278074],
-        "maintenance_cost": [253.15324433],
-        "OpEx": [1654583.87113044],
-        "H2_cost_in_startup_year": [355111.9254],
-        "energy_cost_in_startup_year": [9885.33],
-        "non_energy_cost_in_startup_year": [2282.92326095],
-        "variable_cost_in_startup_year": [12168.25326095],
-        "credits_byproduct": [0.0],
-    }
+def test_simple_ammonia_cost_model(ammonia_cost_prob):
+    prob = ammonia_cost_prob
 
-    for out, expected in expected_outputs.items():
-        with subtests.test(out):
-            val = prob.get_val(f"ammonia_cost.{out}")
-            assert pytest.approx(val, rel=1e-6) == expected[0]
+    names = tuple(f"ammonia_cost.{k}" for k in EXPECTED_COSTS)
+    n_outputs = len(names)
+    actual = np.fromiter((val[0] for val in map(prob.get_val, names)), float, count=n_outputs)
+    expected = np.fromiter(EXPECTED_COSTS.values(), float, count=n_outputs)
+    np.testing.assert_allclose(actual, expected, rtol=1e-6, err_msg=f"outputs: {names}")
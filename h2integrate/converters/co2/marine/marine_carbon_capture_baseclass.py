@@ -4,7 +4,7 @@ from h2integrate.core.utilities import BaseConfig
 from h2integrate.core.model_baseclasses import CostModelBaseClass, PerformanceModelBaseClass
 
 
-@define(kw_only=True)
+@define(kw_only=True, frozen=True)
 class MarineCarbonCapturePerformanceConfig(BaseConfig):
     """Configuration options for marine carbon capture performance modeling.
 
@@ -66,8 +66,14 @@ class MarineCarbonCaptureCostBaseClass(CostModelBaseClass):
 
     def setup(self):
         super().setup()
+        # n_timesteps is number of timesteps in a simulation
+        self.n_timesteps = self.options["plant_config"]["plant"]["simulation"]["n_timesteps"]
         self.add_input(
-            "electricity_in", val=0.0, shape=8760, units="W", desc="Hourly input electricity (W)"
+            "electricity_in",
+            val=0.0,
+            shape=self.n_timesteps,
+            units="W",
+            desc="Hourly input electricity (W)",
         )
         # TODO: replaced with annual_co2_produced
         self.add_input(
@@ -85,7 +85,6 @@ class OAEPerformanceModel(MarineCarbonCapturePerformanceBaseClass):
             additional_cls_name=self.__class__.__name__,
         )
         super().setup()
-        n_timesteps = self.options["plant_config"]["plant"]["simulation"]["n_timesteps"]
 
         self.add_output(
             "plant_mCC_capacity_mtph",
@@ -95,46 +94,49 @@ class OAEPerformanceModel(MarineCarbonCapturePerformanceBaseClass):
         )
         self.add_output(
             "alkaline_seawater_flow_rate",
-            shape=n_timesteps,
+            shape=self.n_timesteps,
             val=0.0,
             units="m**3/s",
             desc="Alkaline seawater flow rate (m³/s)",
         )
         self.add_output(
-            "alkaline_seawater_pH", val=0.0, shape=n_timesteps, desc="pH of the alkaline seawater"
+            "alkaline_seawater_pH",
+            val=0.0,
+            shape=self.n_timesteps,
+            desc="pH of the alkaline seawater",
         )
         self.add_output(
             "alkaline_seawater_dic",
             val=0.0,
-            shape=n_timesteps,
+            shape=self.n_timesteps,
             units="mol/L",
             desc="Dissolved inorganic carbon concentration in the alkaline seawater",
         )
         self.add_output(
             "alkaline_seawater_ta",
             val=0.0,
-            shape=n_timesteps,
+            shape=self.n_timesteps,
             units="mol/L",
             desc="Total alkalinity of the alkaline seawater",
         )
         self.add_output(
             "alkaline_seawater_salinity",
             val=0.0,
-            shape=n_timesteps,
+            shape=self.n_timesteps,
             units="ppt",
             desc="Salinity of the alkaline seawater",
         )
         self.add_output(
             "alkaline_seawater_temp",
             val=0.0,
-            shape=n_timesteps,
+            shape=self.n_timesteps,
             units="C",
             desc="Temperature of the alkaline seawater (°C)",
         )
         self.add_output(
             "excess_acid",
             val=0.0,
-            shape=n_timesteps,
+            shape=self.n_timesteps,
             units="m**3",
             desc="Excess acid produced (m³)",
         )
@@ -177,7 +179,7 @@ class OAEPerformanceModel(MarineCarbonCapturePerformanceBaseClass):
         self.add_output(
             "unused_energy",
             val=0.0,
-            shape=n_timesteps,
+            shape=self.n_timesteps,
             units="W",
             desc="Unused energy unused by OAE system (W)",
         )
@@ -376,7 +378,6 @@ class OAECostAndFinancialModel(MarineCarbonCaptureCostBaseClass):
                 additional_cls_name=self.__class__.__name__,
             )
         super().setup()
-        n_timesteps = self.options["plant_config"]["plant"]["simulation"]["n_timesteps"]
         self.add_input(
             "LCOE",
             val=0.0,
@@ -392,7 +393,7 @@ class OAECostAndFinancialModel(MarineCarbonCaptureCostBaseClass):
         self.add_input(
             "unused_energy",
             val=0.0,
-            shape=n_timesteps,
+            shape=self.n_timesteps,
             units="W",
             desc="Unused energy unused by OAE system (W)",
         )
@@ -7,8 +7,18 @@ import openmdao.api as om
 from pytest import fixture
 from openmdao.utils.assert_utils import assert_near_equal
 
+from h2integrate.converters.test.utilities import assert_standard_converter_outputs
 
-@fixture
+
+_HAS_MCM = importlib.util.find_spec("mcm") is not None
+
+_RNG = np.random.default_rng(seed=42)
+_BASE_POWER = np.linspace(3.0e8, 2.0e8, 8760)  # 5 MW to 10 MW over 8760 hours
+POWER_PROFILE = _BASE_POWER + _RNG.normal(loc=0, scale=0.5e8, size=8760)  # ±0.5 MW noise
+POWER_PROFILE.setflags(write=False)
+
+
+@fixture(scope="module")
 def plant_config():
     plant_config = {
         "plant": {
@@ -22,7 +32,7 @@ def plant_config():
     return plant_config
 
 
-@fixture
+@fixture(scope="module")
 def tech_config():
     return {
         "model_inputs": {
@@ -49,7 +59,7 @@ def tech_config():
     }
 
 
-@fixture
+@fixture(scope="module")
 def driver_config():
     driver_config = {
         "general": {
@@ -59,8 +69,8 @@ def driver_config():
     return driver_config
 
 
-@pytest.mark.skipif(importlib.util.find_spec("mcm") is None, reason="mcm is not installed")
-def test_doc_outputs(driver_config, plant_config, tech_config, subtests):
+@fixture(scope="module")
+def doc_prob(driver_config, plant_config, tech_config):
     from h2integrate.converters.co2.marine.direct_ocean_capture import DOCPerformanceModel
 
     doc_model = DOCPerformanceModel(
@@ -69,95 +79,32 @@ def test_doc_outputs(driver_config, plant_config, tech_config, subtests):
     prob = om.Problem(model=om.Group())
     prob.model.add_subsystem("comp", doc_model, promotes=["*"])
     prob.setup()
-    rng = np.random.default_rng(seed=42)
-    base_power = np.linspace(3.0e8, 2.0e8, 8760)  # 5 MW to 10 MW over 8760 hours
-    noise = rng.normal(loc=0, scale=0.5e8, size=8760)  # ±0.5 MW noise
-    power_profile = base_power + noise
-    prob.set_val("comp.electricity_in", power_profile, units="W")
+    prob.set_val("comp.electricity_in", POWER_PROFILE, units="W")
 
     # Run the model
     prob.run_model()
+    return prob
 
-    plant_life = int(plant_config["plant"]["plant_life"])
-    n_timesteps = int(plant_config["plant"]["simulation"]["n_timesteps"])
-
-    commodity = "co2"
-    commodity_amount_units = "kg"
-    commodity_rate_units = "kg/h"
 
-    # Check that replacement schedule is between 0 and 1
-    with subtests.test("0 <= replacement_schedule <=1"):
-        assert np.all(prob.get_val("comp.replacement_schedule", units="unitless") >= 0)
-        assert np.all(prob.get_val("comp.replacement_schedule", units="unitless") <= 1)
+@pytest.mark.skipif(not _HAS_MCM, reason="mcm is not installed")
+def test_doc_outputs(doc_prob, plant_config, subtests):
+    prob = doc_prob
 
-    with subtests.test("replacement_schedule length"):
-        assert len(prob.get_val("comp.replacement_schedule", units="unitless")) == plant_life
-
-    # Check that capacity factor is between 0 and 1 with units of "unitless"
-    with subtests.test("0 <= capacity_factor (unitless) <=1"):
-        assert np.all(prob.get_val("comp.capacity_factor", units="unitless") >= 0)
-        assert np.all(prob.get_val("comp.capacity_factor", units="unitless") <= 1)
-
-    # Check that capacity factor is between 1 and 100 with units of "percent"
-    with subtests.test("1 <= capacity_factor (percent) <=1"):
-        assert np.all(prob.get_val("comp.capacity_factor", units="percent") >= 1)
-        assert np.all(prob.get_val("comp.capacity_factor", units="percent") <= 100)
-
-    with subtests.test("capacity_factor length"):
-        assert len(prob.get_val("comp.capacity_factor", units="unitless")) == plant_life
-
-    # Test that rated commodity production is greater than zero
-    with subtests.test(f"rated_{commodity}_production > 0"):
-        assert np.all(
-            prob.get_val(f"comp.rated_{commodity}_production", units=commodity_rate_units) > 0
-        )
-
-    with subtests.test(f"rated_{commodity}_production length"):
-        assert (
-            len(prob.get_val(f"comp.rated_{commodity}_production", units=commodity_rate_units)) == 1
-        )
-
-    # Test that total commodity production is greater than zero
-    with subtests.test(f"total_{commodity}_produced > 0"):
-        assert np.all(
-            prob.get_val(f"comp.total_{commodity}_produced", units=commodity_amount_units) > 0
-        )
-    with subtests.test(f"total_{commodity}_produced length"):
-        assert (
-            len(prob.get_val(f"comp.total_{commodity}_produced", units=commodity_amount_units)) == 1
-        )
-
-    # Test that annual commodity production is greater than zero
-    with subtests.test(f"annual_{commodity}_produced > 0"):
-        assert np.all(
-            prob.get_val(f"comp.annual_{commodity}_produced", units=f"{commodity_amount_units}/yr")
-            > 0
-        )
-
-    with subtests.test(f"annual_{commodity}_produced[1:] == annual_{commodity}_produced[0]"):
-        annual_production = prob.get_val(
-            f"comp.annual_{commodity}_produced", units=f"{commodity_amount_units}/yr"
-        )
-        assert np.all(annual_production[1:] == annual_production[0])
-
-    with subtests.test(f"annual_{commodity}_produced length"):
-        assert len(annual_production) == plant_life
-
-    # Test that commodity output has some values greater than zero
-    with subtests.test(f"Some of {commodity}_out > 0"):
-        assert np.any(prob.get_val(f"comp.{commodity}_out", units=commodity_rate_units) > 0)
-
-    with subtests.test(f"{commodity}_out length"):
-        assert len(prob.get_val(f"comp.{commodity}_out", units=commodity_rate_units)) == n_timesteps
+    plant_life = int(plant_config["plant"]["plant_life"])
+    n_timesteps = int(plant_config["plant"]["simulation"]["n_timesteps"])
 
-    # Test default values
-    with subtests.test("operational_life default value"):
-        assert prob.get_val("comp.operational_life", units="yr") == plant_life
-    with subtests.test("replacement_schedule value"):
-        assert np.all(prob.get_val("comp.replacement_schedule", units="unitless") == 0)
+    assert_standard_converter_outputs(
+        prob,
+        subtests,
+        commodity="co2",
+        commodity_rate_units="kg/h",
+        commodity_amount_units="kg",
+        plant_life=plant_life,
+        n_timesteps=n_timesteps,
+    )
 
 
-@unittest.skipUnless(importlib.util.find_spec("mcm") is not None, "mcm is not installed")
+@unittest.skipUnless(_HAS_MCM, "mcm is not installed")
 class TestDOCPerformanceModel(unittest.TestCase):
     def setUp(self):
         from h2integrate.converters.co2.marine.direct_ocean_capture import DOCPerformanceModel
@@ -210,11 +157,7 @@ class TestDOCPerformanceModel(unittest.TestCase):
 
     def test_performance_model(self):
         # Set inputs
-        rng = np.random.default_rng(seed=42)
-        base_power = np.linspace(3.0e8, 2.0e8, 8760)  # 5 MW to 10 MW over 8760 hours
-        noise = rng.normal(loc=0, scale=0.5e8, size=8760)  # ±0.5 MW noise
-        power_profile = base_power + noise
-        self.prob.set_val("DOC.electricity_in", power_profile, units="W")
+        self.prob.set_val("DOC.electricity_in", POWER_PROFILE, units="W")
 
         # Run the model
         self.prob.run_model()
@@ -226,13 +169,13 @@ class TestDOCPerformanceModel(unittest.TestCase):
         total_tank_volume_m3 = self.prob.get_val("total_tank_volume_m3")
 
         # Assert values (allowing for small numerical tolerance)
-        assert_near_equal(np.linalg.norm(co2_out), 11394970.06218, tolerance=1e-1)
+        assert_near_equal(np.dot(co2_out, co2_out), 11394970.06218**2, tolerance=0.21)
         assert_near_equal(np.linalg.norm(co2_capture_mtpy), [1041164.44000004], tolerance=1e-5)
         assert_near_equal(plant_mCC_capacity_mtph, [176.34], tolerance=1e-2)
         assert_near_equal(total_tank_volume_m3, [25920.0], tolerance=1e-2)
 
 
-@unittest.skipUnless(importlib.util.find_spec("mcm") is None, "mcm is installed")
+@unittest.skipUnless(not _HAS_MCM, "mcm is installed")
 class TestDOCPerformanceModelNoMCM(unittest.TestCase):
     def test_no_mcm_import(self):
         from h2integrate.converters.co2.marine.direct_ocean_capture import DOCPerformanceModel
@@ -2,12 +2,20 @@ import numpy as np
 from attrs import field, define
 
 from h2integrate.core.utilities import merge_shared_inputs
+from h2integrate.tools.constants import H_MW
 from h2integrate.converters.hydrogen.geologic.h2_well_subsurface_baseclass import (
     GeoH2SubsurfacePerformanceConfig,
     GeoH2SubsurfacePerformanceBaseClass,
 )
 
 
+# Molecular weight of the non-hydrogen balance of the wellhead gas in g/mol, based on the Aspen
+# models in aspen_surface_processing.py
+BALANCE_MW = 23.32
+# Balance gas to H2 molecular weight ratio used in the mol % to mass % conversion
+BALANCE_TO_H2_MW_RATIO = BALANCE_MW / (2 * H_MW)
+
+
 @define(kw_only=True)
 class NaturalGeoH2PerformanceConfig(GeoH2SubsurfacePerformanceConfig):
     """Configuration for performance parameters for a natural geologic hydrogen subsurface well.
@@ -19,7 +27,8 @@ class NaturalGeoH2PerformanceConfig(GeoH2SubsurfacePerformanceConfig):
 
     Attributes:
         use_prospectivity (bool):
-            Whether to use prospectivity parameter (if true), or manually enter H2 conc. (if false)
+            Whether to use prospectivity parameter (if true), or manually enter H2 conc. (if false).
+            The prospectivity fit is only available for a `rock_type` of `"peridotite"`.
 
         site_prospectivity (float):
             Dimensionless site assessment factor representing the natural hydrogen
@@ -42,6 +51,15 @@ class NaturalGeoH2PerformanceConfig(GeoH2SubsurfacePerformanceConfig):
     initial_wellhead_flow: float = field()
     gas_reservoir_size: float = field()
 
+    def __attrs_post_init__(self):
+        # TODO: sub-models for different rock types
+        if self.use_prospectivity and self.rock_type != "peridotite":
+            raise ValueError(
+                "The site prospectivity fit is only available for peridotite. Set "
+                "'use_prospectivity' to False and provide 'wellhead_h2_concentration' for "
+                f"rock_type '{self.rock_type}'."
+            )
+
 
 class NaturalGeoH2PerformanceModel(GeoH2SubsurfacePerformanceBaseClass):
     """OpenMDAO component for modeling the performance of a subsurface well for a
@@ -103,7 +121,6 @@ class NaturalGeoH2PerformanceModel(GeoH2SubsurfacePerformanceBaseClass):
             additional_cls_name=self.__class__.__name__,
         )
         super().setup()
-        n_timesteps = self.options["plant_config"]["plant"]["simulation"]["n_timesteps"]
 
         self.add_input("site_prospectivity", units="unitless", val=self.config.site_prospectivity)
         self.add_input(
@@ -115,41 +132,40 @@ class NaturalGeoH2PerformanceModel(GeoH2SubsurfacePerformanceBaseClass):
         self.add_output("wellhead_h2_concentration_mass", units="percent")
         self.add_output("wellhead_h2_concentration_mol", units="percent")
         self.add_output("lifetime_wellhead_flow", units="kg/h")
-        self.add_output("wellhead_gas_out_natural", units="kg/h", shape=(n_timesteps,))
+        self.add_output("wellhead_gas_out_natural", units="kg/h", shape=(self.n_timesteps,))
         self.add_output("max_wellhead_gas", units="kg/h")
 
+        # Ratio of the lifetime-average to the initial wellhead flow (temp. fit to Arps data)
+        lifetime = self.options["plant_config"]["plant"]["plant_life"]
+        self.lifetime_flow_ratio = -0.193 * np.log(lifetime) + 0.6871
+
     def compute(self, inputs, outputs):
-        if self.config.rock_type == "peridotite":  # TODO: sub-models for different rock types
-            # Calculate expected wellhead h2 concentration from prospectivity
-            prospectivity = inputs["site_prospectivity"]
-            if self.config.use_prospectivity:
-                wh_h2_conc = 58.92981751 * prospectivity**2.460718753  # percent
-            else:
-                wh_h2_conc = inputs["wellhead_h2_concentration"]
+        if self.config.use_prospectivity:
+            # Calculate expected wellhead h2 concentration from prospectivity (peridotite fit)
+            prospectivity = inputs["site_prospectivity"][0]
+            wh_h2_conc = 58.92981751 * prospectivity**2.460718753  # percent
+        else:
+            wh_h2_conc = inputs["wellhead_h2_concentration"][0]
 
         # Calculated average wellhead gas flow over well lifetime
-        init_wh_flow = inputs["initial_wellhead_flow"]
-        lifetime = self.options["plant_config"]["plant"]["plant_life"]
-        n_timesteps = self.options["plant_config"]["plant"]["simulation"]["n_timesteps"]
-        avg_wh_flow = (-0.193 * np.log(lifetime) + 0.6871) * init_wh_flow  # temp. fit to Arps data
+        init_wh_flow = inputs["initial_wellhead_flow"][0]
+        avg_wh_flow = self.lifetime_flow_ratio * init_wh_flow
 
         # Calculated hydrogen flow out
-        balance_mw = 23.32  # Note: this is based on Aspen models in aspen_surface_processing.py
-        h2_mw = 2.016
         x_h2 = wh_h2_conc / 100
-        w_h2 = x_h2 * h2_mw / (x_h2 * h2_mw + (1 - x_h2) * balance_mw)
+        w_h2 = x_h2 / (x_h2 + (1 - x_h2) * BALANCE_TO_H2_MW_RATIO)
         avg_h2_flow = w_h2 * avg_wh_flow
 
         # Parse outputs
         outputs["wellhead_h2_concentration_mass"] = w_h2 * 100
         outputs["wellhead_h2_concentration_mol"] = wh_h2_conc
         outputs["lifetime_wellhead_flow"] = avg_wh_flow
-        outputs["wellhead_gas_out_natural"] = np.full(n_timesteps, avg_wh_flow)
-        outputs["wellhead_gas_out"] = np.full(n_timesteps, avg_wh_flow)
-        outputs["hydrogen_out"] = np.full(n_timesteps, avg_h2_flow)
+        outputs["wellhead_gas_out_natural"] = avg_wh_flow
+        outputs["wellhead_gas_out"] = avg_wh_flow
+        outputs["hydrogen_out"] = avg_h2_flow
         outputs["max_wellhead_gas"] = init_wh_flow
-        outputs["total_wellhead_gas_produced"] = np.sum(outputs["wellhead_gas_out"])
-        outputs["total_hydrogen_produced"] = np.sum(outputs["hydrogen_out"])
+        outputs["total_wellhead_gas_produced"] = avg_wh_flow * self.n_timesteps
+        outputs["total_hydrogen_produced"] = avg_h2_flow * self.n_timesteps
         outputs["annual_hydrogen_produced"] = outputs["total_hydrogen_produced"] * (
             1 / self.fraction_of_year_simulated
         )
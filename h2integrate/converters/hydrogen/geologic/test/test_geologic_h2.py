@@ -312,3 +312,53 @@ def test_aspen_geoh2_refit_coeffs(
     # Remove refit coefficient files
     cost_out_fpath.unlink()
     perf_out_fpath.unlink()
+
+
+def test_natural_geoh2_rock_type(subtests, plant_config):
+    perf_config = {
+        "shared_parameters": {
+            "borehole_depth": 300,
+            "well_diameter": "small",
+            "well_geometry": "vertical",
+        },
+        "performance_parameters": {
+            "rock_type": "bei_troctolite",
+            "grain_size": 0.01,
+            "use_prospectivity": False,
+            "site_prospectivity": 0.7,
+            "wellhead_h2_concentration": 95,
+            "initial_wellhead_flow": 4000,
+            "gas_reservoir_size": 1000000,
+        },
+    }
+
+    prob = om.Problem()
+    prob.model.add_subsystem(
+        "well",
+        NaturalGeoH2PerformanceModel(
+            plant_config=plant_config,
+            tech_config={"model_inputs": perf_config},
+            driver_config={},
+        ),
+    )
+    prob.setup()
+    prob.run_model()
+
+    with subtests.test("Manual concentration for non-peridotite rock"):
+        assert (
+            pytest.approx(prob.get_val("well.wellhead_h2_concentration_mol", units="percent")) == 95
+        )
+
+    with subtests.test("Prospectivity fit requires peridotite"):
+        perf_config["performance_parameters"]["use_prospectivity"] = True
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            "well",
+            NaturalGeoH2PerformanceModel(
+                plant_config=plant_config,
+                tech_config={"model_inputs": perf_config},
+                driver_config={},
+            ),
+        )
+        with pytest.raises(ValueError, match="only available for peridotite"):
+            prob.setup()
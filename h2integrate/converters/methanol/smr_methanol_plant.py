@@ -80,34 +80,36 @@ class SMRMethanolPlantPerformanceModel(MethanolPerformanceBaseClass):
     def compute(self, inputs, outputs):
         n_timesteps = len(inputs["ng_in"])
         # Calculate max methanol production from each input
-        syn_in = inputs["meoh_syn_cat_in"]
-        atr_in = inputs["meoh_atr_cat_in"]
+        syn_in = inputs["meoh_syn_cat_in"][0]
+        atr_in = inputs["meoh_atr_cat_in"][0]
         ng_in = inputs["ng_in"]
-        syn_ratio = inputs["meoh_syn_cat_consume_ratio"]
-        atr_ratio = inputs["meoh_atr_cat_consume_ratio"]
-        ng_ratio = inputs["ng_consume_ratio"]
-        meoh_from_syn = np.ones(n_timesteps) * syn_in / syn_ratio / n_timesteps
-        meoh_from_atr = np.ones(n_timesteps) * atr_in / atr_ratio / n_timesteps
+        syn_ratio = inputs["meoh_syn_cat_consume_ratio"][0]
+        atr_ratio = inputs["meoh_atr_cat_consume_ratio"][0]
+        ng_ratio = inputs["ng_consume_ratio"][0]
+        meoh_from_syn = syn_in / syn_ratio / n_timesteps
+        meoh_from_atr = atr_in / atr_ratio / n_timesteps
         meoh_from_ng = ng_in / ng_ratio
 
         # Limiting methanol production per hour
-        meoh_prod = np.minimum.reduce([meoh_from_syn, meoh_from_atr, meoh_from_ng])
-        meoh_cap = np.ones(n_timesteps) * inputs["plant_capacity_kgpy"] / n_timesteps
-        meoh_prod = np.minimum.reduce([meoh_prod, meoh_cap])
+        meoh_prod = np.minimum(meoh_from_syn, meoh_from_ng)
+        np.minimum(meoh_prod, meoh_from_atr, out=meoh_prod)
+        meoh_cap = inputs["plant_capacity_kgpy"][0] / n_timesteps
+        np.minimum(meoh_prod, meoh_cap, out=meoh_prod)
 
         # Get co-product ratio0
-        elec_ratio = inputs["elec_produce_ratio"]
+        elec_ratio = inputs["elec_produce_ratio"][0]
+
+        total_meoh_prod = np.sum(meoh_prod)
 
         # Parse outputs
-        outputs["meoh_syn_cat_consume"] = np.sum(meoh_prod) * syn_ratio
-        outputs["meoh_atr_cat_consume"] = np.sum(meoh_prod) * atr_ratio
+        outputs["meoh_syn_cat_consume"] = total_meoh_prod * syn_ratio
+        outputs["meoh_atr_cat_consume"] = total_meoh_prod * atr_ratio
         outputs["ng_consume"] = meoh_prod * ng_ratio
         outputs["methanol_out"] = meoh_prod
-        outputs["total_methanol_produced"] = np.sum(meoh_prod)
+        outputs["total_methanol_produced"] = total_meoh_prod
         outputs["electricity_out"] = meoh_prod * elec_ratio
 
         outputs["rated_methanol_production"] = inputs["plant_capacity_kgpy"] / 8760
-        outputs["total_methanol_produced"] = outputs["methanol_out"].sum()
         max_production = len(meoh_prod) * inputs["plant_capacity_kgpy"] / 8760
         outputs["capacity_factor"] = outputs["total_methanol_produced"] / max_production
         outputs["annual_methanol_produced"] = outputs["total_methanol_produced"] * (
@@ -0,0 +1,95 @@
+import numpy as np
+
+
+def assert_standard_converter_outputs(
+    prob,
+    subtests,
+    commodity: str,
+    commodity_rate_units: str,
+    commodity_amount_units: str,
+    plant_life: int,
+    n_timesteps: int,
+    prefix: str = "comp",
+):
+    """Check the outputs every converter inherits from `PerformanceModelBaseClass`.
+
+    Each output is fetched from the problem once and reused across the subtests.
+
+    Args:
+        prob (om.Problem): Problem that has already been set up and run.
+        subtests: The pytest ``subtests`` fixture of the calling test.
+        commodity (str): Name of the commodity produced by the converter, e.g. "ammonia".
+        commodity_rate_units (str): Units of the commodity production rate, e.g. "kg/h".
+        commodity_amount_units (str): Units of an amount of the commodity, e.g. "kg".
+        plant_life (int): Number of years the plant operates for.
+        n_timesteps (int): Number of timesteps in the simulation.
+        prefix (str, optional): Name of the converter subsystem in the problem.
+            Defaults to "comp".
+    """
+    replacement_schedule = prob.get_val(f"{prefix}.replacement_schedule", units="unitless")
+    capacity_factor = prob.get_val(f"{prefix}.capacity_factor", units="unitless")
+    capacity_factor_percent = prob.get_val(f"{prefix}.capacity_factor", units="percent")
+    rated_production = prob.get_val(
+        f"{prefix}.rated_{commodity}_production", units=commodity_rate_units
+    )
+    total_production = prob.get_val(
+        f"{prefix}.total_{commodity}_produced", units=commodity_amount_units
+    )
+    annual_production = prob.get_val(
+        f"{prefix}.annual_{commodity}_produced", units=f"{commodity_amount_units}/yr"
+    )
+    commodity_out = prob.get_val(f"{prefix}.{commodity}_out", units=commodity_rate_units)
+
+    # Check that replacement schedule is between 0 and 1
+    with subtests.test("0 <= replacement_schedule <=1"):
+        assert replacement_schedule.min() >= 0 and replacement_schedule.max() <= 1
+
+    with subtests.test("replacement_schedule length"):
+        assert replacement_schedule.size == plant_life
+
+    # Check that capacity factor is between 0 and 1 with units of "unitless"
+    with subtests.test("0 <= capacity_factor (unitless) <=1"):
+        assert capacity_factor.min() >= 0 and capacity_factor.max() <= 1
+
+    # Check that capacity factor is between 1 and 100 with units of "percent"
+    with subtests.test("1 <= capacity_factor (percent) <=1"):
+        assert capacity_factor_percent.min() >= 1 and capacity_factor_percent.max() <= 100
+
+    with subtests.test("capacity_factor length"):
+        assert capacity_factor.size == plant_life
+
+    # Test that rated commodity production is greater than zero
+    with subtests.test(f"rated_{commodity}_production > 0"):
+        assert np.all(rated_production > 0)
+
+    with subtests.test(f"rated_{commodity}_production length"):
+        assert rated_production.size == 1
+
+    # Test that total commodity production is greater than zero
+    with subtests.test(f"total_{commodity}_produced > 0"):
+        assert np.all(total_production > 0)
+    with subtests.test(f"total_{commodity}_produced length"):
+        assert total_production.size == 1
+
+    # Test that annual commodity production is greater than zero
+    with subtests.test(f"annual_{commodity}_produced > 0"):
+        assert np.all(annual_production > 0)
+
+    with subtests.test(f"annual_{commodity}_produced[1:] == annual_{commodity}_produced[0]"):
+        assert np.ptp(annual_production) == 0.0
+
+    with subtests.test(f"annual_{commodity}_produced length"):
+        assert annual_production.size == plant_life
+
+    # Test that commodity output has some values greater than zero
+    with subtests.test(f"Some of {commodity}_out > 0"):
+        assert np.any(commodity_out > 0)
+
+    with subtests.test(f"{commodity}_out length"):
+        assert commodity_out.size == n_timesteps
+
+    # Test default values
+    with subtests.test("operational_life default value"):
+        assert prob.get_val(f"{prefix}.operational_life", units="yr") == plant_life
+    with subtests.test("replacement_schedule value"):
+        assert np.all(replacement_schedule == 0)
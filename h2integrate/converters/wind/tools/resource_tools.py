@@ -6,6 +6,8 @@ RHO_0 = 1.225  # Air density at sea level (kg/m3)
 T_REF = 20  # Standard air temperature (Celsius)
 MOLAR_MASS_AIR = 28.96  # Molar mass of air (g/mol)
 LAPSE_RATE = 0.0065  # Temperature lapse rate (K/m) for 0-11000m above sea level
+T_REF_K = convert_temperature(T_REF, "C", "K")  # Standard air temperature (K)
+BAROMETRIC_EXPONENT = g * (MOLAR_MASS_AIR / 1e3) / (R * LAPSE_RATE)  # Barometric exponent (-)
 
 
 def calculate_air_density(elevation_m: float) -> float:
@@ -28,15 +30,9 @@ def calculate_air_density(elevation_m: float) -> float:
     # Reference elevation at sea level (m)
     elevation_sea_level = 0.0
 
-    # Convert temperature to Kelvin
-    T_ref_K = convert_temperature([T_REF], "C", "K")[0]
-
-    # Exponent value used in equation below
-    e = g * (MOLAR_MASS_AIR / 1e3) / (R * LAPSE_RATE)
-
     # Calculate air density at site elevation
-    rho = RHO_0 * ((T_ref_K - ((elevation_m - elevation_sea_level) * LAPSE_RATE)) / T_ref_K) ** (
-        e - 1
+    rho = RHO_0 * ((T_REF_K - ((elevation_m - elevation_sea_level) * LAPSE_RATE)) / T_REF_K) ** (
+        BAROMETRIC_EXPONENT - 1
     )
     return rho
 
@@ -22,8 +22,8 @@ class BatteryOutputs:
     n_cycles: Sequence
     P_chargeable: Sequence
     P_dischargeable: Sequence
-    unmet_demand: list[float]
-    unused_commodity: list[float]
+    unmet_demand: Sequence
+    unused_commodity: Sequence
 
     """
     Container for simulated outputs from the `BatteryStateful` and H2I dispatch models.
@@ -39,8 +39,8 @@ class BatteryOutputs:
         P_chargeable (Sequence): Maximum estimated chargeable power [kW] per timestep.
         P_dischargeable (Sequence): Maximum estimated dischargeable power [kW] per timestep.
 
-        unmet_demand (list[float]): Unmet demand [kW] per timestep.
-        unused_commodity (list[float]): Unused available commodity [kW] per timestep.
+        unmet_demand (Sequence): Unmet demand [kW] per timestep.
+        unused_commodity (Sequence): Unused available commodity [kW] per timestep.
     """
 
     def __init__(self, n_timesteps, n_control_window):
@@ -394,11 +394,9 @@ class PySAMBatteryPerformanceModel(BatteryPerformanceBaseClass):
                 time_step_duration=self.dt_hr,
                 control_variable=self.config.control_variable,
             )
-            n_time_steps = len(inputs["electricity_demand"])
-
             # determine battery discharge
             self.outputs.P = battery_power
-            battery_power_out = [np.max([0, battery_power[i]]) for i in range(n_time_steps)]
+            battery_power_out = np.maximum(battery_power, 0.0)
 
             # calculate combined power out from inflow source and battery (note: battery_power is
             # negative when charging)
@@ -408,17 +406,15 @@ class PySAMBatteryPerformanceModel(BatteryPerformanceBaseClass):
             total_power_out = np.minimum(inputs["electricity_demand"], combined_power_out)
 
             # determine how much of the inflow electricity was unused
-            self.outputs.unused_commodity = [
-                np.max([0, combined_power_out[i] - inputs["electricity_demand"][i]])
-                for i in range(n_time_steps)
-            ]
+            self.outputs.unused_commodity = np.maximum(
+                combined_power_out - inputs["electricity_demand"], 0.0
+            )
             unused_commodity = self.outputs.unused_commodity
 
             # determine how much demand was not met
-            self.outputs.unmet_demand = [
-                np.max([0, inputs["electricity_demand"][i] - combined_power_out[i]])
-                for i in range(n_time_steps)
-            ]
+            self.outputs.unmet_demand = np.maximum(
+                inputs["electricity_demand"] - combined_power_out, 0.0
+            )
             unmet_demand = self.outputs.unmet_demand
 
         outputs["unmet_electricity_demand_out"] = unmet_demand